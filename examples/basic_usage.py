@@ -11,40 +11,49 @@ Author: Sai Ganesh Kolan
 License: MIT
 """
 
+import functools
+
 import numpy as np
 import pandas as pd
 from tabularforge import TabularForge
+from tabularforge.utils.datasets import format_preview, make_demographic_data, make_patient_data
+
+
+# Separator lines used in the printed output
+RULE = "-" * 60
+THIN_RULE = "-" * 40
+BANNER = "*" * 60
 
+# One Generator shared by every TabularForge in the examples; each forge
+# draws its own seed from it
+RNG = np.random.default_rng(42)
 
+
+@functools.lru_cache(maxsize=1)
 def create_sample_data():
-    """Create a sample dataset for demonstration."""
-    np.random.seed(42)
-    n_samples = 1000
-    
-    # Create realistic sample data
-    data = pd.DataFrame({
-        # Demographics
-        "age": np.random.normal(35, 12, n_samples).clip(18, 75).astype(int),
-        "gender": np.random.choice(["male", "female", "other"], n_samples, p=[0.48, 0.48, 0.04]),
-        "country": np.random.choice(["UK", "US", "Germany", "France", "Spain"], n_samples),
-        
-        # Financial
-        "income": np.random.lognormal(10.5, 0.8, n_samples).astype(int),
-        "credit_score": np.random.normal(700, 80, n_samples).clip(300, 850).astype(int),
-        
-        # Behavioral
-        "purchase_frequency": np.random.poisson(5, n_samples),
-        "loyalty_score": np.random.uniform(0, 100, n_samples).round(2),
-        
-        # Categorical
-        "membership_tier": np.random.choice(
-            ["bronze", "silver", "gold", "platinum"], 
-            n_samples, 
-            p=[0.5, 0.3, 0.15, 0.05]
-        ),
-    })
-    
-    return data
+    """
+    Create a sample dataset for demonstration.
+    
+    The dataset is built once and cached, so all examples share the same
+    DataFrame. Treat it as read-only.
+    """
+    return make_demographic_data(n_samples=1000, rng=np.random.default_rng(42))
+
+
+@functools.lru_cache(maxsize=None)
+def get_forge(categorical_columns=None, numerical_columns=None):
+    """
+    Return a TabularForge fit on the sample data, fitting it on first use.
+    
+    Forges are cached per column specification, so examples that use the
+    same settings share one fit. Pass column lists as tuples so they can
+    be used as cache keys.
+    """
+    return TabularForge(
+        create_sample_data(),
+        categorical_columns=list(categorical_columns) if categorical_columns else None,
+        numerical_columns=list(numerical_columns) if numerical_columns else None,
+    )
 
 
 def example_1_basic_usage():
@@ -53,21 +62,22 @@ def example_1_basic_usage():
     -------------------------------------------
     The simplest way to generate synthetic data.
     """
-    print("\n" + "-"*60)
+    print("\n" + RULE)
     print("Example 1: Basic Synthetic Data Generation")
-    print("-"*60)
+    print(RULE)
     
     # Create sample data
     real_data = create_sample_data()
     print(f"\nOriginal data shape: {real_data.shape}")
-    print(f"Original data sample:\n{real_data.head()}")
+    print(f"Original data sample:\n{format_preview(real_data)}")
     
     # Generate synthetic data in ONE line!
-    forge = TabularForge(real_data)
+    # (get_forge() is just TabularForge(real_data), shared with Example 3)
+    forge = get_forge()
     synthetic_data = forge.generate(n_samples=500)
     
     print(f"\nSynthetic data shape: {synthetic_data.shape}")
-    print(f"Synthetic data sample:\n{synthetic_data.head()}")
+    print(f"Synthetic data sample:\n{format_preview(synthetic_data)}")
     
     return synthetic_data
 
@@ -78,9 +88,9 @@ def example_2_with_privacy():
     ----------------------------------------------------
     Add formal privacy guarantees to your synthetic data.
     """
-    print("\n" + "-"*60)
+    print("\n" + RULE)
     print("Example 2: Synthetic Data with Differential Privacy")
-    print("-"*60)
+    print(RULE)
     
     real_data = create_sample_data()
     
@@ -88,14 +98,14 @@ def example_2_with_privacy():
     forge = TabularForge(
         real_data,
         privacy_epsilon=1.0,  # Lower = more privacy, more noise
-        random_state=42       # For reproducibility
+        random_state=RNG      # For reproducibility
     )
     
     private_synthetic = forge.generate(n_samples=500)
     
     print(f"\nGenerated {len(private_synthetic)} private synthetic samples")
     print(f"Privacy epsilon: {forge._privacy_epsilon}")
-    print(f"\nSample:\n{private_synthetic.head()}")
+    print(f"\nSample:\n{format_preview(private_synthetic)}")
     
     return private_synthetic
 
@@ -106,33 +116,28 @@ def example_3_quality_evaluation():
     ---------------------------------------------
     Check how well synthetic data matches the original.
     """
-    print("\n" + "-"*60)
+    print("\n" + RULE)
     print("Example 3: Evaluating Synthetic Data Quality")
-    print("-"*60)
+    print(RULE)
     
-    real_data = create_sample_data()
-    
-    forge = TabularForge(real_data)
+    # Reuse the shared default forge (fitted on first use)
+    forge = get_forge()
     synthetic_data = forge.generate(n_samples=1000)
     
     # Evaluate quality
     quality = forge.evaluate_quality(synthetic_data)
     
     print("\nQuality Metrics:")
-    print("-" * 40)
-    for metric, score in quality.items():
-        print(f"  {metric}: {score:.2%}")
+    print(THIN_RULE)
+    print(pd.Series(quality).to_string(float_format="{:.2%}".format))
     
     # Evaluate privacy
     privacy = forge.evaluate_privacy(synthetic_data)
     
     print("\nPrivacy Metrics:")
-    print("-" * 40)
-    for metric, score in privacy.items():
-        if isinstance(score, float):
-            print(f"  {metric}: {score:.4f}")
-        else:
-            print(f"  {metric}: {score}")
+    print(THIN_RULE)
+    # float_format only applies to the float entries; others print as-is
+    print(pd.Series(privacy).to_string(float_format="{:.4f}".format))
     
     return quality, privacy
 
@@ -143,9 +148,9 @@ def example_4_different_generators():
     ------------------------------------------
     TabularForge supports multiple generation algorithms.
     """
-    print("\n" + "-"*60)
+    print("\n" + RULE)
     print("Example 4: Comparing Different Generators")
-    print("-"*60)
+    print(RULE)
     
     real_data = create_sample_data()
     
@@ -157,14 +162,14 @@ def example_4_different_generators():
         forge = TabularForge(
             real_data,
             generator=gen_name,
-            random_state=42
+            random_state=RNG
         )
         
         synthetic = forge.generate(n_samples=200)
         quality = forge.evaluate_quality(synthetic)
         
         print(f"  Quality: {quality['statistical_similarity']:.2%}")
-        print(f"  Sample:\n{synthetic.head(3)}")
+        print(f"  Sample:\n{format_preview(synthetic, 3)}")
 
 
 def example_5_column_specification():
@@ -173,16 +178,15 @@ def example_5_column_specification():
     -----------------------------------------------
     Sometimes you want to explicitly specify column types.
     """
-    print("\n" + "-"*60)
+    print("\n" + RULE)
     print("Example 5: Explicit Column Type Specification")
-    print("-"*60)
-    
-    real_data = create_sample_data()
+    print(RULE)
     
-    forge = TabularForge(
-        real_data,
-        categorical_columns=["gender", "country", "membership_tier"],
-        numerical_columns=["age", "income", "credit_score", "purchase_frequency", "loyalty_score"],
+    # Same as TabularForge(real_data, categorical_columns=[...], numerical_columns=[...]),
+    # cached so re-running this example reuses the fit
+    forge = get_forge(
+        categorical_columns=("gender", "country", "membership_tier"),
+        numerical_columns=("age", "income", "credit_score", "purchase_frequency", "loyalty_score"),
     )
     
     print("\nEncoder detected:")
@@ -199,23 +203,12 @@ def example_6_healthcare_use_case():
     --------------------------------
     Generate synthetic patient data for research.
     """
-    print("\n" + "-"*60)
+    print("\n" + RULE)
     print("Example 6: Healthcare Use Case")
-    print("-"*60)
+    print(RULE)
     
     # Create mock patient data
-    np.random.seed(42)
-    n_patients = 500
-    
-    patient_data = pd.DataFrame({
-        "patient_age": np.random.normal(55, 15, n_patients).clip(18, 90).astype(int),
-        "bmi": np.random.normal(26, 5, n_patients).clip(15, 45).round(1),
-        "blood_pressure_systolic": np.random.normal(125, 15, n_patients).clip(90, 180).astype(int),
-        "blood_pressure_diastolic": np.random.normal(80, 10, n_patients).clip(60, 120).astype(int),
-        "cholesterol": np.random.choice(["normal", "high", "very_high"], n_patients, p=[0.6, 0.3, 0.1]),
-        "diabetes": np.random.choice(["no", "type1", "type2"], n_patients, p=[0.85, 0.05, 0.1]),
-        "smoker": np.random.choice(["never", "former", "current"], n_patients, p=[0.5, 0.3, 0.2]),
-    })
+    patient_data = make_patient_data(n_samples=500, rng=np.random.default_rng(42))
     
     print(f"Original patient records: {len(patient_data)}")
     
@@ -223,13 +216,13 @@ def example_6_healthcare_use_case():
     forge = TabularForge(
         patient_data,
         privacy_epsilon=0.5,  # Strong privacy for healthcare
-        random_state=42
+        random_state=RNG
     )
     
     synthetic_patients = forge.generate(n_samples=1000)
     
     print(f"Generated synthetic patients: {len(synthetic_patients)}")
-    print(f"\nSynthetic patient sample:\n{synthetic_patients.head()}")
+    print(f"\nSynthetic patient sample:\n{format_preview(synthetic_patients)}")
     
     # Evaluate
     quality = forge.evaluate_quality(synthetic_patients)
@@ -239,9 +232,9 @@ def example_6_healthcare_use_case():
 
 
 if __name__ == "__main__":
-    print("\n" + "*"*60)
+    print("\n" + BANNER)
     print("# TabularForge Examples")
-    print("*"*60)
+    print(BANNER)
     
     # Run all examples
     example_1_basic_usage()
@@ -251,6 +244,6 @@ if __name__ == "__main__":
     example_5_column_specification()
     example_6_healthcare_use_case()
     
-    print("\n" + "-"*60)
+    print("\n" + RULE)
     print("All examples completed successfully!")
-    print("-"*60)
+    print(RULE)
@@ -4,62 +4,75 @@ My TabularForge Test Script
 import pandas as pd
 import numpy as np
 from tabularforge import TabularForge
+from tabularforge.utils.datasets import format_preview, make_demographic_data
+
+# One Generator for the data and every forge below
+RNG = np.random.default_rng(42)
+
+# Separator line used in the printed output
+RULE = "=" * 50
+
+GENDER_DTYPE = pd.CategoricalDtype(['M', 'F'])
+COUNTRY_DTYPE = pd.CategoricalDtype(['UK', 'US', 'Germany'])
+
 
 # Create sample data
 print("Creating sample data...")
-np.random.seed(42)
-data = pd.DataFrame({
-    'age': np.random.normal(35, 10, 1000).clip(18, 75).astype(int),
-    'income': np.random.lognormal(10, 1, 1000).astype(int),
-    'gender': np.random.choice(['M', 'F'], 1000),
-    'country': np.random.choice(['UK', 'US', 'Germany'], 1000),
-    'score': np.random.uniform(0, 100, 1000).round(2)
-})
+data = make_demographic_data(
+    n_samples=1000,
+    rng=RNG,
+    columns=['age', 'income', 'gender', 'country', 'loyalty_score'],
+    params={
+        'age': {'sigma': 10},
+        'income': {'mean': 10, 'sigma': 1},
+        'gender': {'dtype': GENDER_DTYPE, 'p': None},
+        'country': {'dtype': COUNTRY_DTYPE},
+    }
+).rename(columns={'loyalty_score': 'score'})
 
 print(f"Original data shape: {data.shape}")
-print(f"\nOriginal data sample:\n{data.head()}")
+print(f"\nOriginal data sample:\n{format_preview(data)}")
 
 # Generate synthetic data
-print("\n" + "="*50)
+print("\n" + RULE)
 print("Generating synthetic data...")
-print("="*50)
+print(RULE)
 
-forge = TabularForge(data, generator='copula', random_state=42)
+forge = TabularForge(data, generator='copula', random_state=RNG)
 synthetic = forge.generate(n_samples=500)
 
 print(f"\nSynthetic data shape: {synthetic.shape}")
-print(f"\nSynthetic data sample:\n{synthetic.head()}")
+print(f"\nSynthetic data sample:\n{format_preview(synthetic)}")
 
 # Evaluate quality
-print("\n" + "="*50)
+print("\n" + RULE)
 print("Evaluating quality...")
-print("="*50)
+print(RULE)
 
 quality = forge.evaluate_quality(synthetic)
 print("\nQuality Metrics:")
-for metric, score in quality.items():
-    print(f"  {metric}: {score:.2%}")
+print(pd.Series(quality).to_string(float_format="{:.2%}".format))
 
 # Evaluate privacy
-print("\n" + "="*50)
+print("\n" + RULE)
 print("Evaluating privacy...")
-print("="*50)
+print(RULE)
 
 privacy = forge.evaluate_privacy(synthetic)
 print("\nPrivacy Metrics:")
-for metric, value in privacy.items():
-    if isinstance(value, float):
-        print(f"  {metric}: {value:.4f}")
+privacy_scores = pd.Series(privacy)
+privacy_scores = privacy_scores[privacy_scores.map(lambda value: isinstance(value, float))]
+print(privacy_scores.to_string(float_format="{:.4f}".format))
 
 # Test with privacy
-print("\n" + "="*50)
+print("\n" + RULE)
 print("Testing with differential privacy (epsilon=1.0)...")
-print("="*50)
+print(RULE)
 
-forge_private = TabularForge(data, privacy_epsilon=1.0, random_state=42)
+forge_private = TabularForge(data, privacy_epsilon=1.0, random_state=RNG)
 private_synthetic = forge_private.generate(n_samples=500)
-print(f"\nPrivate synthetic sample:\n{private_synthetic.head()}")
+print(f"\nPrivate synthetic sample:\n{format_preview(private_synthetic)}")
 
-print("\n" + "="*50)
+print("\n" + RULE)
 print("✅ All tests completed successfully!")
-print("="*50)
\ No newline at end of file
+print(RULE)
\ No newline at end of file
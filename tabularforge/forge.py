@@ -19,6 +19,7 @@ License: MIT
 
 # IMPORTS
 # Standard library imports (built into Python)
+import copy
 import logging
 from typing import Dict, List, Optional, Union, Any
 
@@ -56,6 +57,26 @@ AVAILABLE_GENERATORS: Dict[str, type] = {
 }
 
 
+def _resolve_random_state(
+    random_state: Optional[Union[int, np.random.Generator]]
+) -> Optional[int]:
+    """
+    Convert a random_state argument to an int seed.
+    
+    Ints and None are returned unchanged. For a NumPy Generator, one seed is
+    drawn from it, so the same seeded Generator gives the same results.
+    
+    Args:
+        random_state: Int seed, NumPy Generator, or None
+        
+    Returns:
+        Int seed, or None
+    """
+    if isinstance(random_state, np.random.Generator):
+        return int(random_state.integers(0, 2**31 - 1))
+    return random_state
+
+
 class TabularForge:
     """
     TabularForge: Privacy-Preserving Synthetic Tabular Data Generation
@@ -96,7 +117,7 @@ class TabularForge:
         numerical_columns: Optional[List[str]] = None,
         datetime_columns: Optional[List[str]] = None,
         privacy_epsilon: Optional[float] = None,
-        random_state: Optional[int] = None,
+        random_state: Optional[Union[int, np.random.Generator]] = None,
         verbose: bool = True
     ) -> None:
         """
@@ -142,8 +163,11 @@ class TabularForge:
                 - 1.0: Balanced privacy/utility
                 - 10.0: Weak privacy, high utility
                 
-            random_state (int, optional): 
+            random_state (int or np.random.Generator, optional): 
                 Seed for random number generator. Use for reproducible results.
+                A NumPy Generator can be passed instead of an int; one seed is
+                drawn from it, so a single Generator can be threaded through
+                several TabularForge instances reproducibly.
                 If None, results will vary between runs.
                 
             verbose (bool, optional): 
@@ -202,6 +226,9 @@ class TabularForge:
         # Store the original data (make a copy to avoid modifying user's data)
         self.data: pd.DataFrame = data.copy()
         
+        # Turn a Generator into an int seed (the generators expect ints)
+        random_state = _resolve_random_state(random_state)
+        
         # Store configuration parameters
         self._generator_name: str = generator.lower()
         self._privacy_epsilon: Optional[float] = privacy_epsilon
@@ -282,6 +309,81 @@ class TabularForge:
         self._n_original_samples: int = len(data)
         self._column_names: List[str] = list(data.columns)
     
+    def with_generator(
+        self,
+        generator: str,
+        random_state: Optional[Union[int, np.random.Generator]] = None,
+        verbose: Optional[bool] = None
+    ) -> "TabularForge":
+        """
+        Create a new TabularForge that reuses this one's preprocessing.
+        
+        The fitted encoder, transformer and privacy settings are shared with
+        this instance, so only the new generator has to be fitted. This is
+        much cheaper than constructing a new TabularForge on the same data
+        when comparing several generators.
+        
+        Args:
+            generator (str): 
+                Name of the generator to fit (see TabularForge.__init__).
+                
+            random_state (int or np.random.Generator, optional): 
+                Seed for the new generator. If None, uses this instance's
+                random_state.
+                
+            verbose (bool, optional): 
+                Whether the new instance logs progress. If None, uses this
+                instance's verbose setting.
+                
+        Returns:
+            TabularForge: 
+                A new, fitted TabularForge using the requested generator.
+                
+        Raises:
+            ValueError: If generator name is invalid.
+            
+        Example:
+            >>> forge = TabularForge(real_data, random_state=42)
+            >>> ctgan_forge = forge.with_generator('ctgan')
+            >>> synthetic = ctgan_forge.generate(n_samples=1000)
+        """
+        # Check that generator name is valid
+        if generator.lower() not in AVAILABLE_GENERATORS:
+            available = ", ".join(AVAILABLE_GENERATORS.keys())
+            raise ValueError(
+                f"Unknown generator '{generator}'. "
+                f"Available generators: {available}"
+            )
+        
+        if random_state is None:
+            random_state = self._random_state
+        random_state = _resolve_random_state(random_state)
+        
+        # Shallow copy: the data, encoder, transformer and privacy mechanism
+        # are only read after fitting, so they can be safely shared
+        forge = copy.copy(self)
+        forge._generator_name = generator.lower()
+        forge._random_state = random_state
+        if verbose is not None:
+            forge._verbose = verbose
+        
+        # Set random seed if provided (for reproducibility)
+        if random_state is not None:
+            np.random.seed(random_state)
+        
+        generator_class = AVAILABLE_GENERATORS[forge._generator_name]
+        forge.generator = generator_class(random_state=random_state)
+        
+        if forge._verbose:
+            logger.info(f"Fitting {forge._generator_name} generator...")
+        
+        # Re-apply the fitted encoding rather than keeping the encoded
+        # training set on every instance; only the generator is refit
+        transformed_data = self.transformer.transform(self.data, self.encoder)
+        forge.generator.fit(transformed_data, self.encoder)
+        
+        return forge
+    
     def generate(
         self,
         n_samples: int = 1000,
@@ -507,16 +609,8 @@ class TabularForge:
                 logger.info(f"Benchmarking {gen_name}...")
             
             try:
-                # Create a new TabularForge with this generator
-                temp_forge = TabularForge(
-                    self.data,
-                    generator=gen_name,
-                    categorical_columns=self.encoder.categorical_columns,
-                    numerical_columns=self.encoder.numerical_columns,
-                    privacy_epsilon=self._privacy_epsilon,
-                    random_state=self._random_state,
-                    verbose=False
-                )
+                # Fit this generator on the already-fitted encoding
+                temp_forge = self.with_generator(gen_name, verbose=False)
                 
                 # Generate and evaluate
                 synthetic = temp_forge.generate(n_samples=n_samples)
@@ -122,11 +122,12 @@ class UtilityMetrics:
             
             # Convert to numeric
             for col in feature_cols:
-                if X_real[col].dtype == object:
+                col_dtype = X_real[col].dtype
+                if col_dtype == object or isinstance(col_dtype, pd.CategoricalDtype):
                     X_real[col] = pd.Categorical(X_real[col]).codes
                     X_synth[col] = pd.Categorical(X_synth[col]).codes
             
-            if y_real.dtype == object:
+            if y_real.dtype == object or isinstance(y_real.dtype, pd.CategoricalDtype):
                 y_real = pd.Categorical(y_real).codes
                 y_synth = pd.Categorical(y_synth).codes
             
@@ -184,7 +185,8 @@ class UtilityMetrics:
             
             # Convert to numeric
             for col in feature_cols:
-                if X_real[col].dtype == object:
+                col_dtype = X_real[col].dtype
+                if col_dtype == object or isinstance(col_dtype, pd.CategoricalDtype):
                     X_real[col] = pd.Categorical(X_real[col]).codes
                     X_synth[col] = pd.Categorical(X_synth[col]).codes
             
@@ -132,7 +132,7 @@ class DataEncoder:
             encoder = LabelEncoder()
             
             # Handle missing values by converting to string
-            col_data = data[col].fillna("__MISSING__").astype(str)
+            col_data = self._to_label_strings(data[col])
             encoder.fit(col_data)
             
             self._label_encoders[col] = encoder
@@ -224,7 +224,7 @@ class DataEncoder:
                 self.datetime_columns.append(col)
             
             # Check for categorical (object dtype or low cardinality)
-            elif dtype == object or dtype.name == "category":
+            elif dtype == object or isinstance(dtype, pd.CategoricalDtype):
                 self.categorical_columns.append(col)
             
             # Check for numerical with low cardinality (treat as categorical)
@@ -235,6 +235,27 @@ class DataEncoder:
             else:
                 self.numerical_columns.append(col)
     
+    @staticmethod
+    def _to_label_strings(col_data: pd.Series) -> pd.Series:
+        """
+        Convert a categorical column to strings, marking missing values.
+        
+        Args:
+            col_data: Column to convert
+            
+        Returns:
+            Series of strings with NaN replaced by "__MISSING__"
+        """
+        # pandas Categoricals refuse fill values that aren't already a
+        # category, so convert the categories themselves to strings and add
+        # the missing marker as one more category
+        if isinstance(col_data.dtype, pd.CategoricalDtype):
+            col_data = col_data.cat.rename_categories(str)
+            if "__MISSING__" not in col_data.cat.categories:
+                col_data = col_data.cat.add_categories("__MISSING__")
+        
+        return col_data.fillna("__MISSING__").astype(str)
+    
     def transform(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Transform the data using fitted encoders.
@@ -262,7 +283,7 @@ class DataEncoder:
         # Transform categorical columns
         for col in self.categorical_columns:
             if col in transformed.columns:
-                col_data = transformed[col].fillna("__MISSING__").astype(str)
+                col_data = self._to_label_strings(transformed[col])
                 
                 # Handle unseen categories
                 encoder = self._label_encoders[col]
@@ -167,13 +167,27 @@ class DataTransformer:
                     original_dtype = self._original_dtypes[col]
                     
                     # Handle integer columns
+                    # (low-cardinality ones were label-encoded and come back as strings)
                     if pd.api.types.is_integer_dtype(original_dtype):
-                        original_format[col] = original_format[col].round().astype(original_dtype)
+                        values = original_format[col]
+                        if values.dtype == object:
+                            values = pd.to_numeric(values)
+                        original_format[col] = values.round().astype(original_dtype)
                     
                     # Handle float columns (already float, usually fine)
                     elif pd.api.types.is_float_dtype(original_dtype):
                         original_format[col] = original_format[col].astype(original_dtype)
                     
+                    # Handle pandas Categorical columns (same categories as the input).
+                    # The encoder stored every category as a string, so match the
+                    # decoded strings against the string form of each category
+                    elif isinstance(original_dtype, pd.CategoricalDtype):
+                        labels = original_dtype.categories.astype(str)
+                        codes = labels.get_indexer(original_format[col].astype(str))
+                        original_format[col] = pd.Categorical.from_codes(
+                            codes, dtype=original_dtype
+                        )
+                    
                 except (ValueError, TypeError):
                     # If conversion fails, keep as is
                     pass
@@ -95,7 +95,7 @@ class PrivacyAttackSimulator:
         
         # Convert to numeric
         for col in common_cols:
-            if real[col].dtype == object:
+            if real[col].dtype == object or isinstance(real[col].dtype, pd.CategoricalDtype):
                 real[col] = pd.Categorical(real[col]).codes
                 synth[col] = pd.Categorical(synth[col]).codes
         
@@ -172,11 +172,11 @@ class PrivacyAttackSimulator:
         
         # Convert to numeric
         for col in feature_cols:
-            if X_synth[col].dtype == object:
+            if X_synth[col].dtype == object or isinstance(X_synth[col].dtype, pd.CategoricalDtype):
                 X_synth[col] = pd.Categorical(X_synth[col]).codes
                 X_real[col] = pd.Categorical(X_real[col]).codes
         
-        if y_synth.dtype == object:
+        if y_synth.dtype == object or isinstance(y_synth.dtype, pd.CategoricalDtype):
             y_synth = pd.Categorical(y_synth).codes
             y_real = pd.Categorical(y_real).codes
         
@@ -229,7 +229,7 @@ class PrivacyAttackSimulator:
         
         # Convert to numeric
         for col in common_cols:
-            if real[col].dtype == object:
+            if real[col].dtype == object or isinstance(real[col].dtype, pd.CategoricalDtype):
                 real[col] = pd.Categorical(real[col]).codes
                 synth[col] = pd.Categorical(synth[col]).codes
         
@@ -4,7 +4,37 @@ Utils Module
 
 This module contains utility functions for TabularForge.
 
-Currently minimal - will be expanded as needed.
+Components:
+    - sample_categorical: Vectorized categorical sampling with a NumPy Generator
+    - sample_categorical_column: Same, returned as a pandas Categorical
+    - normal_clip: In-place clipped normal draws into a float32 buffer
+    - normal_clip_int: Clipped normal draws cast to int32
+    - lognormal_int: Lognormal draws cast to int32
+    - make_demographic_data: Sample customer dataset used by the examples
+    - make_patient_data: Sample patient dataset used by the examples
+    - format_preview: Print-ready preview of a DataFrame's first rows
 """
 
-__all__ = []
+from tabularforge.utils.datasets import (
+    format_preview,
+    make_demographic_data,
+    make_patient_data,
+)
+from tabularforge.utils.sampling import (
+    lognormal_int,
+    normal_clip,
+    normal_clip_int,
+    sample_categorical,
+    sample_categorical_column,
+)
+
+__all__ = [
+    "sample_categorical",
+    "sample_categorical_column",
+    "normal_clip",
+    "normal_clip_int",
+    "lognormal_int",
+    "make_demographic_data",
+    "make_patient_data",
+    "format_preview",
+]
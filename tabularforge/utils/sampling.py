@@ -0,0 +1,267 @@
+"""
+Sampling Utilities Module
+
+This module provides small, vectorized helpers for drawing random columns
+with a NumPy ``Generator``. They are used to build the sample datasets in
+the examples and scripts, and are cheap enough to use anywhere a column of
+random values is needed.
+
+Example Usage:
+    >>> import numpy as np
+    >>> from tabularforge.utils.sampling import sample_categorical
+    >>>
+    >>> rng = np.random.default_rng(42)
+    >>> tiers = np.array(["bronze", "silver", "gold"])
+    >>> values = sample_categorical(rng, tiers, [0.6, 0.3, 0.1], 1000)
+
+Author: Sai Ganesh Kolan
+License: MIT
+"""
+
+# IMPORTS
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def sample_categorical(
+    rng: np.random.Generator,
+    categories: np.ndarray,
+    p: Optional[Sequence[float]],
+    n: int
+) -> np.ndarray:
+    """
+    Draw n values from a categorical distribution.
+
+    Args:
+        rng: NumPy random Generator to draw from
+        categories: Array of category labels
+        p: Probability of each category. If None, categories are uniform.
+        n: Number of values to draw
+
+    Returns:
+        Array of n values taken from categories
+
+    Raises:
+        ValueError: If there are no categories, or p is not a valid
+            probability for each category
+    """
+    categories = np.asarray(categories)
+    codes = _sample_codes(rng, len(categories), p, n)
+
+    return np.take(categories, codes)
+
+
+def sample_categorical_column(
+    rng: np.random.Generator,
+    dtype: pd.CategoricalDtype,
+    p: Optional[Sequence[float]],
+    n: int
+) -> pd.Categorical:
+    """
+    Draw n values from a categorical distribution as a pandas Categorical.
+
+    Only the integer codes are sampled; the labels are never materialized,
+    so the result stores one small integer per row instead of a string.
+
+    Args:
+        rng: NumPy random Generator to draw from
+        dtype: CategoricalDtype holding the category labels
+        p: Probability of each category. If None, categories are uniform.
+        n: Number of values to draw
+
+    Returns:
+        Categorical of n values with the given dtype
+
+    Raises:
+        ValueError: If there are no categories, or p is not a valid
+            probability for each category
+    """
+    codes = _sample_codes(rng, len(dtype.categories), p, n)
+
+    return pd.Categorical.from_codes(codes, dtype=dtype)
+
+
+def _sample_codes(
+    rng: np.random.Generator,
+    n_categories: int,
+    p: Optional[Sequence[float]],
+    n: int
+) -> np.ndarray:
+    """
+    Draw n category indices in [0, n_categories).
+
+    Instead of calling ``choice`` (which rebuilds the cumulative distribution
+    on every call), we draw n uniforms once and map them onto the cumulative
+    distribution with a binary search.
+
+    Raises:
+        ValueError: If there are no categories, or p has the wrong shape,
+            has negative entries, or does not sum to 1
+    """
+    if n_categories == 0:
+        raise ValueError("categories must not be empty")
+
+    if p is None:
+        p = np.full(n_categories, 1.0 / n_categories)
+    else:
+        p = np.asarray(p, dtype=np.float64)
+
+        # Same checks as Generator.choice, which this replaces
+        if p.shape != (n_categories,):
+            raise ValueError(
+                f"p must have one probability per category "
+                f"(expected shape ({n_categories},), got {p.shape})"
+            )
+        if np.any(p < 0):
+            raise ValueError("p must not contain negative probabilities")
+        if not np.isclose(p.sum(), 1.0):
+            raise ValueError(f"p must sum to 1 (got {p.sum():.6g})")
+
+    # Build the cumulative distribution and force the last edge to exactly 1
+    # so rounding in cumsum can never produce an out-of-range index
+    cdf = np.cumsum(p, dtype=np.float64)
+    cdf /= cdf[-1]
+
+    # Map uniforms in [0, 1) onto category indices
+    u = rng.random(n, dtype=np.float32)
+    codes = np.searchsorted(cdf, u, side="right")
+
+    if n_categories <= np.iinfo(np.int8).max:
+        codes = codes.astype(np.int8)
+
+    return codes
+
+
+def _scratch(buf: Optional[np.ndarray], n: int) -> np.ndarray:
+    """Return the first n elements of buf, allocating it if None."""
+    if buf is None:
+        return np.empty(n, dtype=np.float32)
+    if len(buf) < n:
+        raise ValueError(
+            f"Scratch buffer has {len(buf)} elements but {n} values were requested"
+        )
+
+    return buf[:n]
+
+
+def normal_clip(
+    rng: np.random.Generator,
+    mu: float,
+    sigma: float,
+    lo: float,
+    hi: float,
+    buf: np.ndarray
+) -> np.ndarray:
+    """
+    Fill a float32 buffer with clipped normal draws, in place.
+
+    The draw, scale, shift and clip all write into buf, so no temporary
+    arrays are allocated. The returned array is buf itself and will be
+    overwritten by the next call that reuses it.
+
+    Args:
+        rng: NumPy random Generator to draw from
+        mu: Mean of the normal distribution
+        sigma: Standard deviation of the normal distribution
+        lo: Lower clipping bound
+        hi: Upper clipping bound
+        buf: float32 array to fill; its length is the number of draws
+
+    Returns:
+        buf, filled with the clipped draws
+    """
+    rng.standard_normal(dtype=np.float32, out=buf)
+    buf *= sigma
+    buf += mu
+    np.clip(buf, lo, hi, out=buf)
+
+    return buf
+
+
+def normal_clip_int(
+    rng: np.random.Generator,
+    mu: float,
+    sigma: float,
+    lo: float,
+    hi: float,
+    n: int,
+    buf: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Draw n clipped normal values, rounded to the nearest int32.
+
+    Args:
+        rng: NumPy random Generator to draw from
+        mu: Mean of the normal distribution
+        sigma: Standard deviation of the normal distribution
+        lo: Lower clipping bound
+        hi: Upper clipping bound
+        n: Number of values to draw
+        buf: Optional float32 scratch buffer of length n, reused across
+            columns to avoid reallocating it. Allocated if None.
+
+    Returns:
+        int32 array of n values
+
+    Raises:
+        ValueError: If buf is shorter than n
+    """
+    out = _scratch(buf, n)
+
+    normal_clip(rng, mu, sigma, lo, hi, out)
+
+    # Round to nearest before casting; a bare cast truncates toward zero,
+    # which biases every value down by half a unit on average
+    np.rint(out, out=out)
+
+    return out.astype(np.int32)
+
+
+def lognormal_int(
+    rng: np.random.Generator,
+    mean: float,
+    sigma: float,
+    n: int,
+    buf: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Draw n lognormal values, rounded to the nearest int32.
+
+    The underlying normal draw, its scaling and the exp all happen in place
+    in a float32 buffer. Values must fit in int32, so keep
+    mean + 6 * sigma below about 21.
+
+    Args:
+        rng: NumPy random Generator to draw from
+        mean: Mean of the underlying normal distribution
+        sigma: Standard deviation of the underlying normal distribution
+        n: Number of values to draw
+        buf: Optional float32 scratch buffer of length n, reused across
+            columns to avoid reallocating it. Allocated if None.
+
+    Returns:
+        int32 array of n values
+
+    Raises:
+        ValueError: If buf is shorter than n, or a drawn value does not
+            fit in int32
+    """
+    out = _scratch(buf, n)
+
+    rng.standard_normal(dtype=np.float32, out=out)
+    out *= sigma
+    out += mean
+    np.exp(out, out=out)
+    np.rint(out, out=out)
+
+    # A plain cast would wrap overflowing values into garbage. Compare
+    # against 2**31 itself: int32 max rounds up to it in float32
+    if out.size and out.max() >= 2.0**31:
+        raise ValueError(
+            f"lognormal draw of {out.max():.3g} does not fit in int32; "
+            f"lower mean ({mean}) or sigma ({sigma})"
+        )
+
+    return out.astype(np.int32)
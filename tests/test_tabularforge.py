@@ -13,6 +13,8 @@ Author: Sai Ganesh Kolan
 License: MIT
 """
 
+import logging
+
 import pytest
 import numpy as np
 import pandas as pd
@@ -22,6 +24,15 @@ from tabularforge.generators import GaussianCopulaGenerator, CTGANGenerator, TVA
 from tabularforge.preprocessing import DataEncoder, DataTransformer
 from tabularforge.privacy import DifferentialPrivacy
 from tabularforge.metrics import StatisticalMetrics
+from tabularforge.utils import (
+    format_preview,
+    lognormal_int,
+    make_demographic_data,
+    make_patient_data,
+    normal_clip_int,
+    sample_categorical,
+    sample_categorical_column,
+)
 
 
 # FIXTURES - Reusable test data
@@ -155,6 +166,66 @@ class TestTabularForge:
         
         pd.testing.assert_frame_equal(synthetic1, synthetic2)
 
+    def test_reproducibility_with_generator_seed(self, sample_data):
+        """Test that a seeded NumPy Generator can be used as random_state."""
+        forge1 = TabularForge(
+            sample_data, random_state=np.random.default_rng(42), verbose=False
+        )
+        synthetic1 = forge1.generate(n_samples=100)
+        
+        forge2 = TabularForge(
+            sample_data, random_state=np.random.default_rng(42), verbose=False
+        )
+        synthetic2 = forge2.generate(n_samples=100)
+        
+        assert isinstance(forge1._random_state, int)
+        pd.testing.assert_frame_equal(synthetic1, synthetic2)
+    
+    def test_benchmark_matches_fresh_forge(self, sample_data, caplog):
+        """Test that benchmark scores match a forge built from scratch, quietly."""
+        forge = TabularForge(sample_data, random_state=42, verbose=True)
+        
+        with caplog.at_level(logging.INFO, logger="tabularforge"):
+            results = forge.benchmark(generators=["copula"], n_samples=100)
+        
+        fresh = TabularForge(
+            sample_data,
+            generator="copula",
+            categorical_columns=forge.encoder.categorical_columns,
+            numerical_columns=forge.encoder.numerical_columns,
+            random_state=42,
+            verbose=False
+        )
+        synthetic = fresh.generate(n_samples=100)
+        quality = fresh.evaluate_quality(synthetic)
+        
+        for metric, value in quality.items():
+            assert results.loc[0, metric] == pytest.approx(value)
+        assert "Fitting" not in caplog.text
+    
+    def test_integer_dtypes_preserved(self, sample_data):
+        """Test that low-cardinality integer columns come back as integers."""
+        data = sample_data.astype({"children": np.int16})
+        forge = TabularForge(data, verbose=False)
+        synthetic = forge.generate(n_samples=100)
+        
+        assert "children" in forge.encoder.categorical_columns
+        assert synthetic["children"].dtype == np.int16
+
+    def test_with_generator(self, sample_data):
+        """Test that with_generator matches a freshly constructed forge."""
+        base = TabularForge(sample_data, generator="tvae", random_state=42, verbose=False)
+        forge1 = base.with_generator("copula", random_state=7)
+        synthetic1 = forge1.generate(n_samples=100)
+
+        forge2 = TabularForge(sample_data, random_state=7, verbose=False)
+        synthetic2 = forge2.generate(n_samples=100)
+
+        assert forge1.encoder is base.encoder
+        assert forge1._generator_name == "copula"
+        assert base._generator_name == "tvae"
+        pd.testing.assert_frame_equal(synthetic1, synthetic2)
+
 
 # DATA ENCODER TESTS
 
@@ -301,6 +372,170 @@ class TestStatisticalMetrics:
         assert scores["overall"] > 0.9
 
 
+# SAMPLING UTILITY TESTS
+
+class TestSamplingUtils:
+    """Tests for the vectorized sampling helpers."""
+
+    def test_sample_categorical(self):
+        """Test that categorical sampling respects the given probabilities."""
+        rng = np.random.default_rng(42)
+        categories = np.array(["a", "b", "c"])
+
+        values = sample_categorical(rng, categories, [0.7, 0.2, 0.1], 10000)
+
+        assert len(values) == 10000
+        assert set(values) <= set(categories)
+        assert abs(np.mean(values == "a") - 0.7) < 0.02
+
+    def test_sample_categorical_uniform(self):
+        """Test uniform sampling when no probabilities are given."""
+        rng = np.random.default_rng(42)
+
+        values = sample_categorical(rng, np.array(["x", "y"]), None, 10000)
+
+        assert abs(np.mean(values == "x") - 0.5) < 0.02
+
+    def test_sample_categorical_invalid_p(self):
+        """Test that invalid probabilities raise ValueError."""
+        rng = np.random.default_rng(42)
+        categories = np.array(["a", "b", "c"])
+
+        with pytest.raises(ValueError, match="one probability per category"):
+            sample_categorical(rng, categories, [0.5, 0.5], 10)
+        with pytest.raises(ValueError, match="negative"):
+            sample_categorical(rng, categories, [1.2, -0.1, -0.1], 10)
+        with pytest.raises(ValueError, match="sum to 1"):
+            sample_categorical(rng, categories, [0.5, 0.3, 0.1], 10)
+        with pytest.raises(ValueError, match=r"got \(1, 3\)"):
+            sample_categorical(rng, categories, [[0.5, 0.3, 0.2]], 10)
+        with pytest.raises(ValueError, match="must not be empty"):
+            sample_categorical(rng, np.array([]), None, 10)
+
+    def test_sample_categorical_column(self):
+        """Test sampling straight into a pandas Categorical."""
+        rng = np.random.default_rng(42)
+        dtype = pd.CategoricalDtype(["a", "b", "c"])
+
+        values = sample_categorical_column(rng, dtype, [0.7, 0.2, 0.1], 1000)
+
+        assert isinstance(values, pd.Categorical)
+        assert values.dtype == dtype
+        assert values.codes.dtype == np.int8
+
+    def test_normal_clip_int(self):
+        """Test clipped normal draws with a shared scratch buffer."""
+        rng = np.random.default_rng(42)
+        buf = np.empty(1000, dtype=np.float32)
+
+        ages = normal_clip_int(rng, 35, 12, 18, 75, 1000, buf)
+        scores = normal_clip_int(rng, 700, 80, 300, 850, 1000, buf)
+
+        assert ages.dtype == np.int32
+        assert ages.min() >= 18 and ages.max() <= 75
+        assert scores.min() >= 300 and scores.max() <= 850
+        assert abs(ages.mean() - 35) < 1.5
+
+    def test_lognormal_int_overflow(self):
+        """Test that lognormal draws too large for int32 raise ValueError."""
+        rng = np.random.default_rng(42)
+
+        with pytest.raises(ValueError, match="does not fit in int32"):
+            lognormal_int(rng, 22, 1, 5)
+
+    def test_short_buffer_raises(self):
+        """Test that a scratch buffer shorter than n raises ValueError."""
+        rng = np.random.default_rng(42)
+        buf = np.empty(10, dtype=np.float32)
+
+        with pytest.raises(ValueError, match="Scratch buffer"):
+            normal_clip_int(rng, 35, 12, 18, 75, 20, buf)
+        with pytest.raises(ValueError, match="Scratch buffer"):
+            lognormal_int(rng, 10.5, 0.8, 20, buf)
+
+    def test_lognormal_int(self):
+        """Test lognormal draws cast to int32."""
+        rng = np.random.default_rng(42)
+
+        incomes = lognormal_int(rng, 10.5, 0.8, 10000)
+
+        assert incomes.dtype == np.int32
+        assert incomes.min() > 0
+        assert abs(np.median(incomes) / np.exp(10.5) - 1) < 0.05
+
+
+# SAMPLE DATASET TESTS
+
+class TestDatasets:
+    """Tests for the sample dataset builders."""
+
+    def test_make_demographic_data(self):
+        """Test the default demographic dataset."""
+        data = make_demographic_data(500, np.random.default_rng(42))
+
+        assert data.shape == (500, 8)
+        assert data["age"].dtype == np.int32
+        assert data["gender"].dtype.name == "category"
+
+    def test_make_demographic_data_columns(self):
+        """Test selecting and ordering columns."""
+        data = make_demographic_data(
+            100, np.random.default_rng(42), columns=["education", "age"]
+        )
+
+        assert list(data.columns) == ["education", "age"]
+
+    def test_make_demographic_data_reproducible(self):
+        """Test that the same seed gives the same data."""
+        data1 = make_demographic_data(100, np.random.default_rng(7))
+        data2 = make_demographic_data(100, np.random.default_rng(7))
+
+        pd.testing.assert_frame_equal(data1, data2)
+
+    def test_make_demographic_data_params(self):
+        """Test overriding a column's distribution parameters."""
+        dtype = pd.CategoricalDtype(["M", "F"])
+        data = make_demographic_data(
+            1000,
+            np.random.default_rng(42),
+            columns=["age", "gender"],
+            params={"age": {"mu": 60, "hi": 90}, "gender": {"dtype": dtype, "p": None}},
+        )
+
+        assert abs(data["age"].mean() - 60) < 2
+        assert data["age"].max() <= 90
+        assert data["gender"].dtype == dtype
+
+        with pytest.raises(ValueError, match="not requested"):
+            make_demographic_data(100, columns=["age"], params={"income": {"sigma": 1}})
+
+    def test_make_demographic_data_unknown_column(self):
+        """Test that unknown column names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown columns"):
+            make_demographic_data(100, columns=["age", "shoe_size"])
+
+    def test_format_preview(self):
+        """Test that only float32 columns are printed at float32 precision."""
+        data = pd.DataFrame({
+            "score": np.array([80.73, 5.1], dtype=np.float32),
+            "income": [1234567.891, 2.0],
+        })
+
+        preview = format_preview(data)
+
+        assert "80.73 " in preview and "80.730003" not in preview
+        assert "1234567.891" in preview
+
+    def test_make_patient_data(self):
+        """Test the patient dataset."""
+        data = make_patient_data(200, np.random.default_rng(42))
+
+        assert data.shape == (200, 7)
+        assert data["patient_age"].between(18, 90).all()
+        assert data["bmi"].dtype == np.float32
+        assert data["smoker"].dtype.name == "category"
+
+
 # INTEGRATION TESTS
 
 class TestIntegration:
@@ -343,6 +578,33 @@ class TestIntegration:
         
         assert len(synthetic) == 100
         assert set(synthetic.columns) == set(data.columns)
+    
+    def test_pandas_categorical_columns(self, sample_data):
+        """Test with columns stored as pandas Categoricals."""
+        data = sample_data.astype({"gender": "category", "education": "category"})
+        
+        forge = TabularForge(data, verbose=False)
+        synthetic = forge.generate(n_samples=100)
+        
+        assert "education" in forge.encoder.categorical_columns
+        assert synthetic["gender"].dtype == data["gender"].dtype
+        
+        privacy = forge.evaluate_privacy(synthetic)
+        assert "membership_inference_risk" in privacy
+    
+    def test_pandas_categorical_integer_categories(self):
+        """Test Categoricals whose categories are not strings."""
+        rng = np.random.default_rng(42)
+        data = pd.DataFrame({
+            "value": rng.normal(size=300),
+            "level": pd.Categorical(rng.integers(1, 4, 300)),
+        })
+        
+        forge = TabularForge(data, verbose=False)
+        synthetic = forge.generate(n_samples=50)
+        
+        assert synthetic["level"].dtype == data["level"].dtype
+        assert synthetic["level"].notna().all()
 
 
 if __name__ == "__main__":